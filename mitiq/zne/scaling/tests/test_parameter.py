@@ -1,72 +1,64 @@
 """Unit tests for parameter scaling."""
-from copy import deepcopy
 import pytest
 import numpy as np
 from cirq import Circuit, LineQubit, ops, CSWAP, ZPowGate
 from mitiq.utils import _equal
 from mitiq.zne.scaling.parameter import scale_parameters, _get_base_gate, CircuitMismatchException, GateTypeException, _generate_parameter_calibration_circuit, compute_parameter_variance
 
+_QREG3 = LineQubit.range(3)
+_QREG2 = LineQubit.range(2)
+_CIRC_XY_3Q = Circuit([ops.X.on_each(_QREG3)], [ops.Y.on(_QREG3[0])])
+_CIRC_CNOT_2Q = Circuit([ops.CNOT.on(*_QREG2)])
+_CIRC_MEAS = Circuit([ops.H.on_each(_QREG3)], [ops.T.on(_QREG3[0])], [ops.measure(_QREG3[1])], [ops.CNOT.on(_QREG3[0], _QREG3[2])], [ops.measure(_QREG3[0], _QREG3[2])])
+
 @pytest.mark.order(0)
 def test_identity_scale_1q():
     """Tests that when scale factor = 1, the circuit is the
     same.
     """
-    qreg = LineQubit.range(3)
-    circ = Circuit([ops.X.on_each(qreg)], [ops.Y.on(qreg[0])])
-    scaled = scale_parameters(circ, scale_factor=1, base_variance=0.001)
-    assert _equal(circ, scaled)
+    scaled = scale_parameters(_CIRC_XY_3Q, scale_factor=1, base_variance=0.001)
+    assert _equal(_CIRC_XY_3Q, scaled)
 
 @pytest.mark.order(0)
 def test_non_identity_scale_1q():
     """Tests that when scale factor = 1, the circuit is the
     same.
     """
-    qreg = LineQubit.range(3)
-    circ = Circuit([ops.rx(np.pi * 1.0).on_each(qreg)], [ops.ry(np.pi * 1.0).on(qreg[0])])
+    circ = Circuit([ops.rx(np.pi * 1.0).on_each(_QREG3)], [ops.ry(np.pi * 1.0).on(_QREG3[0])])
     np.random.seed(42)
     stretch = 2
     base_noise = 0.001
     noises = np.random.normal(loc=0.0, scale=np.sqrt((stretch - 1) * base_noise), size=(4,))
     np.random.seed(42)
     scaled = scale_parameters(circ, scale_factor=stretch, base_variance=base_noise, seed=42)
-    result = []
-    for moment in scaled:
-        for op in moment.operations:
-            gate = deepcopy(op.gate)
-            param = gate.exponent
-            result.append(param * np.pi - np.pi)
-    assert np.all(np.isclose(result - noises, 0))
+    result = np.empty(len(noises))
+    for i, op in enumerate(scaled.all_operations()):
+        result[i] = op.gate.exponent * np.pi - np.pi
+    assert np.allclose(result, noises)
 
 @pytest.mark.order(0)
 def test_identity_scale_2q():
     """Tests that when scale factor = 1, the circuit is the
     same.
     """
-    qreg = LineQubit.range(2)
-    circ = Circuit([ops.CNOT.on(qreg[0], qreg[1])])
-    scaled = scale_parameters(circ, scale_factor=1, base_variance=0.001)
-    assert _equal(circ, scaled)
+    scaled = scale_parameters(_CIRC_CNOT_2Q, scale_factor=1, base_variance=0.001)
+    assert _equal(_CIRC_CNOT_2Q, scaled)
 
 @pytest.mark.order(0)
 def test_non_identity_scale_2q():
     """Tests that when scale factor = 1, the circuit is the
     same.
     """
-    qreg = LineQubit.range(2)
-    circ = Circuit([ops.CNOT.on(qreg[0], qreg[1])])
     np.random.seed(42)
     stretch = 2
     base_noise = 0.001
     noises = np.random.normal(loc=0.0, scale=np.sqrt((stretch - 1) * base_noise), size=(1,))
     np.random.seed(42)
-    scaled = scale_parameters(circ, scale_factor=stretch, base_variance=base_noise, seed=42)
-    result = []
-    for moment in scaled:
-        for op in moment.operations:
-            gate = deepcopy(op.gate)
-            param = gate.exponent
-            result.append(param * np.pi - np.pi)
-    assert np.all(np.isclose(result - noises, 0))
+    scaled = scale_parameters(_CIRC_CNOT_2Q, scale_factor=stretch, base_variance=base_noise, seed=42)
+    result = np.empty(len(noises))
+    for i, op in enumerate(scaled.all_operations()):
+        result[i] = op.gate.exponent * np.pi - np.pi
+    assert np.allclose(result, noises)
 
 @pytest.mark.order(0)
 def test_scale_with_measurement():
@@ -80,10 +72,8 @@ def test_scale_with_measurement():
     2: ───H───────X───M───
 
     """
-    qreg = LineQubit.range(3)
-    circ = Circuit([ops.H.on_each(qreg)], [ops.T.on(qreg[0])], [ops.measure(qreg[1])], [ops.CNOT.on(qreg[0], qreg[2])], [ops.measure(qreg[0], qreg[2])])
-    scaled = scale_parameters(circ, scale_factor=1, base_variance=0.001)
-    assert _equal(circ, scaled)
+    scaled = scale_parameters(_CIRC_MEAS, scale_factor=1, base_variance=0.001)
+    assert _equal(_CIRC_MEAS, scaled)
 
 @pytest.mark.order(0)
 def test_gate_type():